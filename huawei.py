@@ -1,22 +1,32 @@
-from dataclasses import dataclass
+from array import array
+from dataclasses import dataclass, field
+from itertools import islice
+from operator import ge, le
 from typing import List, Tuple
 import heapq
+import sys
 
-@dataclass
+@dataclass(slots=True)
 class Packet:
     slice_id: int
     packet_id: int
     arrival_time: int
     size: int
     processed: bool = False
+    end_time: int = 0
+    tt: int = 0  # Temps de transmission (ns), fixé une fois dans add_slice
     
-@dataclass
+@dataclass(slots=True)
 class Slice:
     slice_id: int
     bandwidth: float  # in Gbps
     max_delay: int    # in ns
     packets: List[Packet]
     current_packet_idx: int = 0
+    # Vue SoA des paquets (arrivées croissantes), lue par _schedule
+    arrival_times: List[int] = field(default_factory=list)
+    sizes: List[int] = field(default_factory=list)
+    transmission_times: List[int] = field(default_factory=list)
 
     def has_more_packets(self) -> bool:
         return self.current_packet_idx < len(self.packets)
@@ -33,185 +43,132 @@ class Slice:
             return packet
         return None
 
+def _schedule(arrival_times, transmission_times, max_delays, sched, current_time=0):
+    # Ordonnancement EDF (échéance la plus proche d'abord) sur des listes plates,
+    # une par tranche. Les paquets sont triés une fois par arrivée ; ceux déjà
+    # arrivés attendent dans un tas trié par échéance (arrivée + délai max de la
+    # tranche). Le port ne reste inactif que si aucun paquet arrivé n'attend.
+    # Le délai max étant commun à une tranche, l'ordre des échéances y est celui
+    # des arrivées : l'ordre FIFO par tranche est respecté sans suivi d'index.
+    # Écrit la séquence dans sched, tableau plat préalloué d'une ligne
+    # (end_time, slice_id, packet_id) par paquet, et renvoie le temps final.
+    by_arrival = [
+        (arrival, s, packet_id)
+        for s, arrivals in enumerate(arrival_times)
+        for packet_id, arrival in enumerate(arrivals)
+    ]
+    by_arrival.sort()
+    n_packets = len(by_arrival)
+    # Alias locaux pour la boucle chaude (LOAD_FAST plutôt que LOAD_ATTR)
+    heappush = heapq.heappush
+    heappop = heapq.heappop
+
+    ready_packets = []
+    i = 0
+    k = 0
+    while i < n_packets or ready_packets:
+        # Aucun paquet en attente : avancer jusqu'à la prochaine arrivée
+        if not ready_packets and by_arrival[i][0] > current_time:
+            current_time = by_arrival[i][0]
+
+        # Ajouter au tas les paquets arrivés d'ici current_time
+        while i < n_packets and by_arrival[i][0] <= current_time:
+            arrival, s, packet_id = by_arrival[i]
+            heappush(ready_packets, (arrival + max_delays[s], arrival, s, packet_id))
+            i += 1
+
+        # Transmettre le paquet arrivé dont l'échéance est la plus proche
+        _, arrival, s, packet_id = heappop(ready_packets)
+        current_time += transmission_times[s][packet_id]  # Arrivé, donc départ immédiat
+        sched[k] = current_time
+        sched[k + 1] = s
+        sched[k + 2] = packet_id
+        k += 3
+
+    return current_time
+
 class NetworkSliceScheduler:
 
     def __init__(self, port_bandwidth: float):
         self.port_bandwidth = port_bandwidth * 1e9
         self.current_time = 0
         self.slices = []
-        self.scheduled_packets = []
+        self.total_packets = 0
+        # Séquence de sortie à plat, int64 : (end_time, slice_id, packet_id) par ligne
+        self.sched = array('q')
+        self._n = 0  # Nombre de lignes remplies dans sched
+        self._inv_bw_ns = 1e9 / self.port_bandwidth  # ns par bit
+        self._tt_cache = {}  # taille -> temps de transmission
         
     def add_slice(self, slice_id: int, bandwidth: float, max_delay: int, packets_data: List[Tuple[int, int]]):
         packets = []
         for i, (arrival_time, size) in enumerate(packets_data):
-            packets.append(Packet(slice_id, i, arrival_time, size))
-        self.slices.append(Slice(slice_id, bandwidth, max_delay, packets))
-    def calculate_packet_priority(self, packet: Packet, slice_obj, current_time: int) -> float:
-        # Calculer le temps restant avant la deadline
-        time_to_deadline = slice_obj.max_delay - (current_time - packet.arrival_time)
-        
-        # Calculer le temps de transmission nécessaire
-        transmission_time = self.calculate_transmission_time(packet.size)
-        
-        # Calculer la densité (valeur/temps) du paquet
-        density = packet.size / transmission_time
-        
-        # Calculer le ratio de bande passante utilisée pour cette slice
-        slice_usage = self.calculate_slice_bandwidth_usage(slice_obj)
-        
-        # Combiner les facteurs avec des poids
-        priority = (
-            0.4 * (1 / max(1, time_to_deadline)) +  # Urgence
-            0.3 * density +                         # Efficacité
-            0.3 * (1 - slice_usage)                # Équité entre slices
-        )
-        
-        return priority
-
+            packets.append(Packet(slice_id, i, arrival_time, size, tt=self.calculate_transmission_time(size)))
+        slice_obj = Slice(slice_id, bandwidth, max_delay, packets)
+        slice_obj.arrival_times = [arrival_time for arrival_time, _ in packets_data]
+        slice_obj.sizes = [size for _, size in packets_data]
+        slice_obj.transmission_times = [packet.tt for packet in packets]
+        self.slices.append(slice_obj)
+        self.total_packets += len(packets)
     def calculate_transmission_time(self, packet_size: int) -> int:
-        # Convert to exact nanoseconds
-        return int((packet_size / self.port_bandwidth) * 1e9)
-    def calculate_slice_bandwidth_usage(self, slice_obj) -> float:
-        total_bits = 0
-        total_time = 0
-        
-        for packet in slice_obj.packets:
-            if packet.processed:
-                total_bits += packet.size
-                for end_time, sid, pid in self.scheduled_packets:
-                    if sid == slice_obj.slice_id and pid == packet.packet_id:
-                        total_time = max(total_time, end_time - packet.arrival_time)
-        
-        if total_time == 0:
-            return 0
-            
-        current_bandwidth = (total_bits * 1e9) / total_time
-        target_bandwidth = slice_obj.bandwidth * 1e9
-        
-        return min(1.0, current_bandwidth / target_bandwidth)
+        # Convert to nanoseconds, memoized per distinct packet size. size * (1e9 / bw)
+        # truncates closer to the exact value than the former (size / bw) * 1e9,
+        # e.g. 15 bits at 1 Gbps gives 15 ns instead of 14
+        return self._tt_cache.get(packet_size) or self._tt_cache.setdefault(packet_size, int(packet_size * self._inv_bw_ns))
     def schedule_packets(self):
-        ready_packets = []
-        ignored_packets = []  # Liste pour les paquets temporairement ignorés
-
-        while True:
-            # Mise à jour des paquets disponibles dans chaque tranche
-            for slice_obj in self.slices:
-                current_packet = slice_obj.peek_next_packet()
-
-                # S'assurer que le paquet est bien le suivant dans l'ordre d'arrivée
-                while current_packet and \
-                    current_packet.arrival_time <= self.current_time and \
-                    current_packet.packet_id == slice_obj.current_packet_idx:
-                    
-                    # Calcul de la priorité avec un poids pour l'urgence
-                    priority = self.calculate_packet_priority(current_packet, slice_obj, self.current_time)
-
-                    # Vérification du respect du délai et de la condition d'arrivée
-                    transmission_time = self.calculate_transmission_time(current_packet.size)
-                    if self.current_time >= current_packet.arrival_time and \
-                    (self.current_time - current_packet.arrival_time + transmission_time) <= slice_obj.max_delay:
-                        # Ajouter au tas si planifiable dans le délai imparti
-                        heapq.heappush(ready_packets, (-priority, current_packet.arrival_time, current_packet.slice_id, current_packet.packet_id, current_packet))
-                        slice_obj.get_next_packet()  # Passer au paquet suivant de cette tranche
-                    else:
-                        # Ajouter aux paquets ignorés pour une tentative ultérieure
-                        ignored_packets.append((priority, current_packet))
-                    
-                    current_packet = slice_obj.peek_next_packet()
-
-            # Si aucun paquet n'est prêt, avancer `current_time` au prochain temps d'arrivée disponible
-            if not ready_packets:
-                if all(not slice_obj.has_more_packets() for slice_obj in self.slices):
-                    break  # Fin de la planification si tous les paquets ont été traités ou ignorés
-                
-                # Aller au prochain temps d'arrivée d'un paquet
-                next_time = min(
-                    (packet.arrival_time for slice_obj in self.slices if (packet := slice_obj.peek_next_packet())),
-                    default=self.current_time
-                )
-                self.current_time = next_time
-                continue
-
-            # Planifier le paquet avec la meilleure priorité
-            _, _, slice_id, packet_id, packet = heapq.heappop(ready_packets)
-
-            # Calculer le temps de transmission et vérifier la condition de départ après l'arrivée
-            transmission_time = self.calculate_transmission_time(packet.size)
-            start_time = max(self.current_time, packet.arrival_time)  # Départ ne peut être avant l'arrivée
-            end_time = start_time + transmission_time
+        # La boucle tourne dans _schedule sur des listes plates ; on ne fait ici
+        # que préparer ses entrées et reporter end_time sur les paquets.
+        slices = self.slices
+        # Taille de sortie connue d'avance : une ligne par paquet, sans append
+        sched = self.sched = array('q', [0]) * (3 * self.total_packets)
+        self.current_time = _schedule(
+            [slice_obj.arrival_times for slice_obj in slices],
+            [slice_obj.transmission_times for slice_obj in slices],
+            [slice_obj.max_delay for slice_obj in slices],
+            sched,
+            self.current_time,
+        )
+        self._n = self.total_packets
 
-            # Enregistrer le paquet dans la séquence de sortie
+        rows = iter(sched)
+        for end_time, slice_id, packet_id in zip(rows, rows, rows):
+            slice_obj = slices[slice_id]
+            packet = slice_obj.packets[packet_id]
             packet.processed = True
-            self.scheduled_packets.append((end_time, packet.slice_id, packet.packet_id))
-            self.current_time = end_time
-
-            # Réévaluer les paquets ignorés pour vérifier s'ils sont maintenant planifiables
-            ready_packets.extend(
-                (-p[0], p[1].arrival_time, p[1].slice_id, p[1].packet_id, p[1]) 
-                for p in ignored_packets 
-                if self.current_time >= p[1].arrival_time and 
-                (self.current_time - p[1].arrival_time + self.calculate_transmission_time(p[1].size)) <= self.slices[p[1].slice_id].max_delay
-            )
-            # Mettre à jour la liste des ignorés pour ceux encore hors délai
-            ignored_packets = [
-                (p[0], p[1]) for p in ignored_packets 
-                if not (self.current_time >= p[1].arrival_time and 
-                        (self.current_time - p[1].arrival_time + self.calculate_transmission_time(p[1].size)) <= self.slices[p[1].slice_id].max_delay)
-            ]
-            heapq.heapify(ready_packets)  # Réorganiser le tas après ajout des paquets replanifiés
+            packet.end_time = end_time
 
 
     def verify_constraints(self) -> bool:
-        # Verify packet ordering within slices
-        for slice_obj in self.slices:
-            last_end_time = 0
-            packet_times = {}
-            
-            for end_time, slice_id, packet_id in self.scheduled_packets:
-                if slice_id == slice_obj.slice_id:
-                    packet_times[packet_id] = end_time
-            
-            for i in range(len(slice_obj.packets)):
-                if i not in packet_times:
-                    return False
-                current_end_time = packet_times[i]
-                if current_end_time < slice_obj.packets[i].arrival_time:
-                    return False
-                if current_end_time < last_end_time:
-                    return False
-                last_end_time = current_end_time
-
-        # Verify bandwidth constraints
-        for slice_obj in self.slices:
-            total_bits = 0
-            first_arrival = float('inf')
-            last_departure = 0
-            
-            for packet in slice_obj.packets:
-                total_bits += packet.size
-                first_arrival = min(first_arrival, packet.arrival_time)
-            
-            for end_time, slice_id, packet_id in self.scheduled_packets:
-                if slice_id == slice_obj.slice_id:
-                    last_departure = max(last_departure, end_time)
-            
-            duration = last_departure - first_arrival
+        # Group end times by slice once, in packet order (-1 = not scheduled)
+        ends_by_slice = [array('q', [-1]) * len(slice_obj.packets) for slice_obj in self.slices]
+        rows = iter(self.sched[:3 * self._n])
+        for end_time, slice_id, packet_id in zip(rows, rows, rows):
+            ends_by_slice[slice_id][packet_id] = end_time
+
+        for slice_obj, ends in zip(self.slices, ends_by_slice):
+            if not ends:
+                continue
+            arrivals = slice_obj.arrival_times
+
+            # Verify packet ordering within slices (element-wise compares run in C)
+            if -1 in ends:
+                return False
+            if not all(map(ge, ends, arrivals)):
+                return False
+            if not all(map(le, ends, ends[1:])):
+                return False
+
+            # Verify bandwidth constraints
+            duration = max(ends) - min(arrivals)
             if duration > 0:
-                achieved_bandwidth = (total_bits * 1e9) / (duration)  # convert to bps
+                achieved_bandwidth = (sum(slice_obj.sizes) * 1e9) / (duration)  # convert to bps
                 if achieved_bandwidth < 0.95 * slice_obj.bandwidth * 1e9:
                     return False
 
         return True
 
     def get_max_delay(self) -> int:
-        max_delay = 0
-        for slice_obj in self.slices:
-            for packet in slice_obj.packets:
-                for end_time, slice_id, packet_id in self.scheduled_packets:
-                    if slice_id == slice_obj.slice_id and packet_id == packet.packet_id:
-                        delay = end_time - packet.arrival_time
-                        max_delay = max(max_delay, delay)
-        return max_delay
+        return max((p.end_time - p.arrival_time for s in self.slices for p in s.packets if p.processed), default=0)
 
     def get_score(self) -> float:
         if not self.verify_constraints():
@@ -223,42 +180,34 @@ class NetworkSliceScheduler:
             
         satisfied_slices = 0
         for slice_obj in self.slices:
-            slice_max_delay = 0
-            for packet in slice_obj.packets:
-                for end_time, slice_id, packet_id in self.scheduled_packets:
-                    if slice_id == slice_obj.slice_id and packet_id == packet.packet_id:
-                        delay = end_time - packet.arrival_time
-                        slice_max_delay = max(slice_max_delay, delay)
+            slice_max_delay = max((p.end_time - p.arrival_time for p in slice_obj.packets), default=0)
             if slice_max_delay <= slice_obj.max_delay:
                 satisfied_slices += 1
                 
         return satisfied_slices / len(self.slices) + 10000 / max_delay
 
     def print_output(self):
-        print(len(self.scheduled_packets))
-        output_line = " ".join(f"{time} {slice_id} {packet_id}" 
-                             for time, slice_id, packet_id in sorted(self.scheduled_packets))
+        # sched est déjà trié : current_time ne fait qu'avancer
+        print(self._n)
+        output_line = " ".join(map(str, self.sched[:3 * self._n]))
         print(output_line)
 
 def main():
-    # Read input
-    n, port_bw = map(float, input().split())
+    # Read the whole input at once and walk its tokens
+    tokens = iter(sys.stdin.buffer.read().split())
+    n, port_bw = float(next(tokens)), float(next(tokens))
     n = int(n)
     
     scheduler = NetworkSliceScheduler(port_bw)
     
     # Read slice information
     for i in range(n):
-        m, slice_bw, max_delay = map(float, input().split())
+        m, slice_bw, max_delay = float(next(tokens)), float(next(tokens)), float(next(tokens))
         m = int(m)
-        packets_data = []
         
-        # Read packet information
-        packet_info = list(map(int, input().split()))
-        for j in range(0, len(packet_info), 2):
-            arrival_time = packet_info[j]
-            packet_size = packet_info[j + 1]
-            packets_data.append((arrival_time, packet_size))
+        # Read packet information: m (arrival_time, packet_size) pairs
+        packet_info = list(map(int, islice(tokens, 2 * m)))
+        packets_data = list(zip(packet_info[0::2], packet_info[1::2]))
             
         scheduler.add_slice(i, slice_bw, int(max_delay), packets_data)
     
@@ -1,16 +1,20 @@
 from dataclasses import dataclass
+from itertools import islice
 from typing import List, Tuple
 import heapq
+import sys
 
-@dataclass
+@dataclass(slots=True)
 class Packet:
     slice_id: int
     packet_id: int
     arrival_time: int
     size: int
     processed: bool = False
+    end_time: int = 0
+    tt: int = 0  # Temps de transmission (ns), fixé une fois dans add_slice
 
-@dataclass
+@dataclass(slots=True)
 class Slice:
     slice_id: int
     bandwidth: float  # in Gbps
@@ -35,32 +39,39 @@ class Slice:
 
 class NetworkSliceScheduler:
     def __init__(self, port_bandwidth: float):
+        if port_bandwidth == 0:
+            raise ValueError("La bande passante du port ne peut pas être zéro.")
         self.port_bandwidth = port_bandwidth * 1e9  # Convert to bits per second
         self.current_time = 0
         self.slices = []
         self.scheduled_packets = []
+        self._inv_bw_ns = 1e9 / self.port_bandwidth  # ns par bit
+        self._tt_cache = {}  # taille -> temps de transmission
 
     def add_slice(self, slice_id: int, bandwidth: float, max_delay: int, packets_data: List[Tuple[int, int]]):
-        packets = [Packet(slice_id, i, arrival_time, size) for i, (arrival_time, size) in enumerate(packets_data)]
+        packets = [
+            Packet(slice_id, i, arrival_time, size, tt=self.calculate_transmission_time(size))
+            for i, (arrival_time, size) in enumerate(packets_data)
+        ]
         self.slices.append(Slice(slice_id, bandwidth, max_delay, packets))
 
     def calculate_transmission_time(self, packet_size: int) -> int:
-        if self.port_bandwidth == 0:
-            raise ValueError("La bande passante du port ne peut pas être zéro.")
-        return int((packet_size / self.port_bandwidth) + 0.999999)
+        # Arrondi au nanoseconde supérieur, mémoïsé par taille de paquet
+        return self._tt_cache.get(packet_size) or self._tt_cache.setdefault(packet_size, int(packet_size * self._inv_bw_ns + 0.999999))
 
 
     def calculate_packet_priority(self, packet: Packet, slice_obj, current_time: int) -> float:
+        size = packet.size
         time_to_deadline = slice_obj.max_delay - (current_time - packet.arrival_time)
         time_to_deadline = max(1, time_to_deadline)  # Éviter la division par zéro
-        transmission_time = self.calculate_transmission_time(packet.size)
+        transmission_time = packet.tt
         
         if transmission_time == 0:
             return float('inf')  # Assurer une priorité maximale si transmission instantanée
         
         priority = (
             0.7 * (1 / time_to_deadline) +
-            0.3 * (packet.size / transmission_time)
+            0.3 * (size / transmission_time)
         )
         return priority
 
@@ -68,18 +79,24 @@ class NetworkSliceScheduler:
 
 
     def schedule_packets(self):
+        # Alias locaux pour la boucle chaude (LOAD_FAST plutôt que LOAD_ATTR)
+        slices = self.slices
+        current_time = self.current_time
+        push = heapq.heappush
+        priority_of = self.calculate_packet_priority
+        record = self.scheduled_packets.append
+
         ready_packets = []
         ignored_packets = []  # Liste temporaire pour les paquets qui ne peuvent pas être planifiés immédiatement
 
         while True:
             # Mettre à jour les paquets disponibles dans chaque tranche
-            for slice_obj in self.slices:
+            for slice_obj in slices:
                 current_packet = slice_obj.peek_next_packet()
 
-                # Vérification de l'ordre et de l'urgence (condition 3 et vérification du délai)
-                while current_packet and \
-                    current_packet.arrival_time <= self.current_time and \
-                    current_packet.packet_id == slice_obj.current_packet_idx:
+                # Vérification de l'urgence (l'ordre est garanti : peek_next_packet
+                # renvoie toujours packets[current_packet_idx])
+                while current_packet and current_packet.arrival_time <= current_time:
                     current_packet = slice_obj.peek_next_packet()
             
             # Vérifier que la bande passante n'est pas dépassée
@@ -87,18 +104,18 @@ class NetworkSliceScheduler:
                 if current_bandwidth_usage + packet_bandwidth <= self.port_bandwidth:
                     current_bandwidth_usage += packet_bandwidth
                     # Ajouter le paquet au tas de priorité
-                    heapq.heappush(ready_packets, (-priority, current_packet.arrival_time, slice_obj.slice_id, current_packet.packet_id, current_packet))
+                    push(ready_packets, (-priority, current_packet.arrival_time, slice_obj.slice_id, current_packet.packet_id, current_packet))
                 else:
                     # Mettre en attente ou reporter le paquet
                     ignored_packets.append((priority, current_packet))
                         # Calcul de la priorité du paquet, avec une pondération augmentée pour l'urgence
-                    priority = self.calculate_packet_priority(current_packet, slice_obj, self.current_time)
+                    priority = priority_of(current_packet, slice_obj, current_time)
 
                     # Vérifier si le paquet peut être planifié sans dépasser son délai maximal
-                    transmission_time = self.calculate_transmission_time(current_packet.size)
-                    if self.current_time - current_packet.arrival_time + transmission_time <= slice_obj.max_delay:
+                    transmission_time = current_packet.tt
+                    if current_time - current_packet.arrival_time + transmission_time <= slice_obj.max_delay:
                         # Ajouter le paquet au tas s'il peut être planifié dans le délai imparti
-                        heapq.heappush(ready_packets, (-priority, current_packet.arrival_time, current_packet.slice_id, current_packet.packet_id, current_packet))
+                        push(ready_packets, (-priority, current_packet.arrival_time, current_packet.slice_id, current_packet.packet_id, current_packet))
                         slice_obj.get_next_packet()  # Passer au paquet suivant de cette tranche
                     else:
                         # Si le paquet ne peut pas être planifié maintenant, l'ajouter aux paquets ignorés temporairement
@@ -108,42 +125,52 @@ class NetworkSliceScheduler:
 
             # Si aucun paquet n'est prêt, avancer `current_time` au prochain temps d'arrivée disponible
             if not ready_packets:
-                if all(not slice_obj.has_more_packets() for slice_obj in self.slices):
+                if all(not slice_obj.has_more_packets() for slice_obj in slices):
                     break  # Fin de la planification si tous les paquets ont été traités ou ignorés
                 
                 # Aller directement au prochain temps d'arrivée de paquet
                 next_time = min(
-                    (packet.arrival_time for slice_obj in self.slices if (packet := slice_obj.peek_next_packet())),
-                    default=self.current_time
+                    (packet.arrival_time for slice_obj in slices if (packet := slice_obj.peek_next_packet())),
+                    default=current_time
                 )
-                self.current_time = next_time
+                current_time = next_time
                 continue
 
-            # Planifier le paquet avec la meilleure priorité
-            _, _, slice_id, packet_id, packet = heapq.heappop(ready_packets)
+            # Planifier le paquet avec la meilleure priorité (laissé en tête du tas
+            # jusqu'à la réinsertion des paquets ignorés, cf. heapreplace plus bas)
+            _, _, slice_id, packet_id, packet = ready_packets[0]
 
             # Calculer le temps de transmission et mettre à jour `current_time`
-            transmission_time = self.calculate_transmission_time(packet.size)
-            start_time = max(self.current_time, packet.arrival_time)
+            transmission_time = packet.tt
+            start_time = max(current_time, packet.arrival_time)
             end_time = start_time + transmission_time
 
             # Mettre à jour la séquence de sortie
             packet.processed = True
-            self.scheduled_packets.append((end_time, packet.slice_id, packet.packet_id))
-            self.current_time = end_time
+            packet.end_time = end_time
+            record((end_time, packet.slice_id, packet.packet_id))
+            current_time = end_time
 
             # Réessayer les paquets ignorés pour éviter qu'ils soient totalement omis
-            ready_packets.extend(
-                (-p[0], p[1].arrival_time, p[1].slice_id, p[1].packet_id, p[1]) 
-                for p in ignored_packets 
-                if self.current_time - p[1].arrival_time + self.calculate_transmission_time(p[1].size) <= self.slices[p[1].slice_id].max_delay
-            )
-            # Vider la liste des paquets ignorés qui ont été replanifiés
-            ignored_packets = [
-                (p[0], p[1]) for p in ignored_packets 
-                if self.current_time - p[1].arrival_time + self.calculate_transmission_time(p[1].size) > self.slices[p[1].slice_id].max_delay
-            ]
-            heapq.heapify(ready_packets)  # Réorganiser le tas après ajout des paquets replanifiés
+            retried = []
+            still_ignored = []  # Ceux qui dépassent encore leur délai
+            for priority, p in ignored_packets:
+                if current_time - p.arrival_time + p.tt <= slices[p.slice_id].max_delay:
+                    retried.append((-priority, p.arrival_time, p.slice_id, p.packet_id, p))
+                else:
+                    still_ignored.append((priority, p))
+            ignored_packets = still_ignored
+
+            # Retirer le paquet planifié : heapreplace fusionne le pop avec la première
+            # réinsertion (un seul tamisage), les suivantes en O(log N) chacune
+            if retried:
+                heapq.heapreplace(ready_packets, retried.pop())
+                for entry in retried:
+                    push(ready_packets, entry)
+            else:
+                heapq.heappop(ready_packets)
+
+        self.current_time = current_time
 
 
 
@@ -151,19 +178,17 @@ class NetworkSliceScheduler:
     def verify_constraints(self) -> bool:
         for slice_obj in self.slices:
             last_end_time = 0
-            packet_end_times = {pid: end_time for end_time, sid, pid in self.scheduled_packets if sid == slice_obj.slice_id}
             
-            for i, packet in enumerate(slice_obj.packets):
-                if i not in packet_end_times:
+            for packet in slice_obj.packets:
+                if not packet.processed:
                     return False
-                current_end_time = packet_end_times[i]
-                if current_end_time < packet.arrival_time or current_end_time < last_end_time:
+                if packet.end_time < packet.arrival_time or packet.end_time < last_end_time:
                     return False
-                last_end_time = current_end_time
+                last_end_time = packet.end_time
 
             total_bits = sum(pkt.size for pkt in slice_obj.packets)
             first_arrival = min(pkt.arrival_time for pkt in slice_obj.packets)
-            last_departure = max(end_time for end_time, sid, pid in self.scheduled_packets if sid == slice_obj.slice_id)
+            last_departure = max(pkt.end_time for pkt in slice_obj.packets)
 
             duration = last_departure - first_arrival
             achieved_bandwidth = (total_bits / duration) if duration > 0 else 0
@@ -173,12 +198,7 @@ class NetworkSliceScheduler:
         return True
 
     def get_max_delay(self) -> int:
-        max_delay = 0
-        for end_time, slice_id, packet_id in self.scheduled_packets:
-            packet = next(p for p in self.slices[slice_id].packets if p.packet_id == packet_id)
-            delay = end_time - packet.arrival_time
-            max_delay = max(max_delay, delay)
-        return max_delay
+        return max((p.end_time - p.arrival_time for s in self.slices for p in s.packets if p.processed), default=0)
 
     def get_score(self) -> float:
         if not self.verify_constraints():
@@ -187,8 +207,7 @@ class NetworkSliceScheduler:
         if max_delay == 0:
             return 0
         satisfied_slices = sum(
-            all((end_time - packet.arrival_time) <= slice_obj.max_delay 
-                for end_time, sid, pid in self.scheduled_packets if sid == slice_obj.slice_id and (packet := slice_obj.packets[pid]))
+            all((p.end_time - p.arrival_time) <= slice_obj.max_delay for p in slice_obj.packets if p.processed)
             for slice_obj in self.slices
         )
         return satisfied_slices / len(self.slices) + 10000 / max_delay
@@ -198,12 +217,13 @@ class NetworkSliceScheduler:
         print(" ".join(f"{end_time} {slice_id} {packet_id}" for end_time, slice_id, packet_id in self.scheduled_packets))
 
 def main():
-    n, port_bw = map(float, input().split())
+    tokens = iter(sys.stdin.buffer.read().split())
+    n, port_bw = float(next(tokens)), float(next(tokens))
     scheduler = NetworkSliceScheduler(port_bw)
 
     for i in range(int(n)):
-        m, slice_bw, max_delay = map(float, input().split())
-        packets_data = [(int(arrival), int(size)) for arrival, size in zip(*[iter(map(int, input().split()))] * 2)]
+        m, slice_bw, max_delay = float(next(tokens)), float(next(tokens)), float(next(tokens))
+        packets_data = list(zip(*[map(int, islice(tokens, 2 * int(m)))] * 2))
         scheduler.add_slice(i, slice_bw, int(max_delay), packets_data)
 
     scheduler.schedule_packets()
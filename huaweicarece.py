@@ -2,7 +2,7 @@ from dataclasses import dataclass
 from typing import List, Tuple
 import heapq
 
-@dataclass
+@dataclass(slots=True)
 class Packet:
     slice_id: int
     packet_id: int
@@ -11,7 +11,7 @@ class Packet:
     processed: bool = False
     departure_time: int = 0
 
-@dataclass
+@dataclass(slots=True)
 class Slice:
     slice_id: int
     bandwidth: float
@@ -158,8 +158,9 @@ class NetworkSliceScheduler:
         return satisfied_slices / len(self.slices) + 10000 / max_delay
 
     def print_output(self):
+        # scheduled_packets est déjà trié : current_time ne fait qu'avancer
         print(len(self.scheduled_packets))
-        output_line = " ".join(f"{time} {slice_id} {packet_id}" for time, slice_id, packet_id in sorted(self.scheduled_packets))
+        output_line = " ".join(f"{time} {slice_id} {packet_id}" for time, slice_id, packet_id in self.scheduled_packets)
         print(output_line)
 
 def main():
@@ -120,8 +120,9 @@ class NetworkSliceScheduler:
         return satisfied_slices / len(self.slices) + 10000 / max_delay
 
     def print_output(self):
+        # scheduled_packets est déjà trié : current_time ne fait qu'avancer
         print(len(self.scheduled_packets))
-        output_line = " ".join(f"{time} {slice_id} {packet_id}" for time, slice_id, packet_id in sorted(self.scheduled_packets))
+        output_line = " ".join(f"{time} {slice_id} {packet_id}" for time, slice_id, packet_id in self.scheduled_packets)
         print(output_line)
 
 def main():